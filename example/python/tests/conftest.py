@@ -0,0 +1,132 @@
+import hashlib
+from importlib import metadata, util
+from pathlib import Path
+
+import pytest
+
+# aws_cdk is imported lazily inside fixtures: loading it starts the jsii
+# runtime, which is not needed when the template comes from the cache.
+
+_STACK_MODULE = "waf_http_api_example.waf_http_api_example_stack"
+
+# Published distributions whose versions affect the synthesized template
+_TEMPLATE_DEPENDENCIES = ("aws-cdk-lib", "constructs")
+
+# The construct is hashed by content: local builds are all packaged as 0.0.0
+_CONSTRUCT_PACKAGE = "waf_http_api"
+
+
+def _template_cache_key():
+    """
+    Build a pytest cache key for the synthesized template.
+
+    The key covers this file (App options and fixtures), the stack source,
+    the installed construct's files and the CDK library versions.
+    """
+    digest = hashlib.sha256()
+    digest.update(Path(__file__).read_bytes())
+    digest.update(Path(util.find_spec(_STACK_MODULE).origin).read_bytes())
+    construct_dir = Path(util.find_spec(_CONSTRUCT_PACKAGE).origin).parent
+    for path in sorted(construct_dir.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            digest.update(path.relative_to(construct_dir).as_posix().encode())
+            digest.update(path.read_bytes())
+    for name in _TEMPLATE_DEPENDENCIES:
+        digest.update(f"{name}=={metadata.version(name)}".encode())
+    return f"waf_http_api_example/template/{digest.hexdigest()}"
+
+
+def _matches(actual, expected):
+    """Partially match ``actual`` against ``expected``.
+
+    Mirrors ``Template.has_resource_properties``: objects only need to
+    contain the expected keys, while arrays must match element by element.
+    """
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _matches(actual[key], value)
+            for key, value in expected.items()
+        )
+    if isinstance(expected, list):
+        return (
+            isinstance(actual, list)
+            and len(actual) == len(expected)
+            and all(_matches(a, e) for a, e in zip(actual, expected))
+        )
+    return actual == expected
+
+
+class TemplateView:
+    """
+    Read-only view over a synthesized CloudFormation template.
+
+    Implements ``has_resource_properties`` and ``has_output`` from
+    ``aws_cdk.assertions.Template`` as plain dict scans, so they work on
+    templates loaded from the cache.
+    """
+
+    def __init__(self, template_json) -> None:
+        self.template_json = template_json
+
+    def resources_of_type(self, resource_type):
+        """Return all resources of the given type."""
+        return [
+            resource
+            for resource in self.template_json.get("Resources", {}).values()
+            if resource["Type"] == resource_type
+        ]
+
+    def has_resource_properties(self, resource_type, properties) -> None:
+        """Assert that a resource of the given type matches ``properties``."""
+        if not any(
+            _matches(resource.get("Properties", {}), properties)
+            for resource in self.resources_of_type(resource_type)
+        ):
+            raise AssertionError(
+                f"No {resource_type} resource matches properties {properties}"
+            )
+
+    def has_output(self, logical_id, props) -> None:
+        """Assert that the output ``logical_id`` exists and matches ``props``."""
+        output = self.template_json.get("Outputs", {}).get(logical_id)
+        if output is None or not _matches(output, props):
+            raise AssertionError(f"No output {logical_id} matches {props}")
+
+
+@pytest.fixture(scope="session")
+def stack():
+    """Create the example stack once per test session."""
+    import aws_cdk as core
+
+    from waf_http_api_example.waf_http_api_example_stack import WafHttpApiExampleStack
+
+    # Use a dedicated App per stack and skip writing tree.json, which is never read
+    app = core.App(tree_metadata=False)
+    return WafHttpApiExampleStack(app, "TestStack")
+
+
+@pytest.fixture(scope="session")
+def template_json(request):
+    """
+    Return the synthesized template as plain dicts.
+
+    The template is stored in the pytest cache keyed by the stack source and
+    dependency versions, so later runs skip synthesis until one of them
+    changes. Run ``pytest --cache-clear`` to force a fresh synth.
+    """
+    cache = request.config.cache
+    key = _template_cache_key()
+    template = cache.get(key, None)
+    if template is None:
+        from aws_cdk import assertions
+
+        stack = request.getfixturevalue("stack")
+        template = assertions.Template.from_stack(stack).to_json()
+        cache.set(key, template)
+    return template
+
+
+@pytest.fixture(scope="session")
+def template(template_json):
+    """Wrap the synthesized template for assertions."""
+    return TemplateView(template_json)
@@ -0,0 +1,77 @@
+import pytest
+
+from tests.conftest import TemplateView
+
+
+TEMPLATE_JSON = {
+    "Resources": {
+        "WebAcl": {
+            "Type": "AWS::WAFv2::WebACL",
+            "Properties": {
+                "Scope": "CLOUDFRONT",
+                "DefaultAction": {"Allow": {}},
+                "VisibilityConfig": {
+                    "MetricName": "WebAcl",
+                    "SampledRequestsEnabled": True,
+                },
+                "Rules": [
+                    {"Name": "RuleA", "Priority": 1},
+                    {"Name": "RuleB", "Priority": 2},
+                ],
+            },
+        },
+        "Role": {
+            "Type": "AWS::IAM::Role",
+        },
+    },
+    "Outputs": {
+        "ApiUrl": {"Value": "https://example.com"},
+    },
+}
+
+
+class TestTemplateView:
+    """Test suite for the TemplateView used by the stack tests."""
+
+    @pytest.fixture
+    def template(self):
+        """Wrap the hand-written template."""
+        return TemplateView(TEMPLATE_JSON)
+
+    def test_nested_partial_object_matches(self, template):
+        """Test that nested objects only need to contain the expected keys."""
+        template.has_resource_properties("AWS::WAFv2::WebACL", {
+            "VisibilityConfig": {
+                "SampledRequestsEnabled": True
+            }
+        })
+
+    def test_array_length_mismatch_fails(self, template):
+        """Test that arrays must match element by element."""
+        with pytest.raises(AssertionError):
+            template.has_resource_properties("AWS::WAFv2::WebACL", {
+                "Rules": [
+                    {"Name": "RuleA"}
+                ]
+            })
+
+    def test_scalar_mismatch_fails(self, template):
+        """Test that a different scalar value does not match."""
+        with pytest.raises(AssertionError):
+            template.has_resource_properties("AWS::WAFv2::WebACL", {
+                "Scope": "REGIONAL"
+            })
+
+    def test_resource_without_properties(self, template):
+        """Test that a resource without Properties only matches empty properties."""
+        template.has_resource_properties("AWS::IAM::Role", {})
+        with pytest.raises(AssertionError):
+            template.has_resource_properties("AWS::IAM::Role", {
+                "RoleName": "MyRole"
+            })
+
+    def test_missing_output_fails(self, template):
+        """Test that a missing output is reported."""
+        template.has_output("ApiUrl", {})
+        with pytest.raises(AssertionError):
+            template.has_output("MissingOutput", {})
@@ -1,24 +1,14 @@
-import aws_cdk as core
-import aws_cdk.assertions as assertions
 import pytest
 
-from waf_http_api_example.waf_http_api_example_stack import WafHttpApiExampleStack
+
+# Keep all stack tests on one worker so they share the session stack and template
+template_group = pytest.mark.xdist_group(name="template")
 
 
 class TestWafHttpApiExampleStack:
     """Test suite for the WAF HTTP API Example Stack."""
 
-    @pytest.fixture
-    def stack(self):
-        """Create a test stack instance."""
-        app = core.App()
-        stack = WafHttpApiExampleStack(app, "TestStack")
-        return stack
-
-    @pytest.fixture
-    def template(self, stack):
-        """Create a CloudFormation template from the stack."""
-        return assertions.Template.from_stack(stack)
+    pytestmark = template_group
 
     def test_lambda_function_created_with_python_312(self, template):
         """Test that Lambda function is created with Python 3.12 runtime."""
@@ -37,20 +27,19 @@ class TestWafHttpApiExampleStack:
 
     def test_api_gateway_routes_created(self, template):
         """Test that API Gateway routes are created."""
+        route_keys = {
+            route["Properties"]["RouteKey"]
+            for route in template.resources_of_type("AWS::ApiGatewayV2::Route")
+        }
+
         # Test GET / route
-        template.has_resource_properties("AWS::ApiGatewayV2::Route", {
-            "RouteKey": "GET /"
-        })
+        assert "GET /" in route_keys
 
         # Test GET /hello route
-        template.has_resource_properties("AWS::ApiGatewayV2::Route", {
-            "RouteKey": "GET /hello"
-        })
+        assert "GET /hello" in route_keys
 
         # Test POST /hello route
-        template.has_resource_properties("AWS::ApiGatewayV2::Route", {
-            "RouteKey": "POST /hello"
-        })
+        assert "POST /hello" in route_keys
 
     def test_cloudfront_distribution_created(self, template):
         """Test that CloudFront distribution is created."""
@@ -108,13 +97,11 @@ class TestWafHttpApiExampleStack:
 
     def test_lambda_has_environment_variable(self, template):
         """Test that Lambda has CloudFront secret environment variable."""
-        template.has_resource_properties("AWS::Lambda::Function", {
-            "Environment": {
-                "Variables": {
-                    "CLOUDFRONT_SECRET": assertions.Match.any_value()
-                }
-            }
-        })
+        variables = [
+            function["Properties"].get("Environment", {}).get("Variables", {})
+            for function in template.resources_of_type("AWS::Lambda::Function")
+        ]
+        assert any("CLOUDFRONT_SECRET" in names for names in variables)
 
     def test_stack_outputs_created(self, template):
         """Test that all required stack outputs are created."""
@@ -126,20 +113,17 @@ class TestWafHttpApiExampleStack:
 
     def test_cloudfront_origin_has_custom_headers(self, template):
         """Test that CloudFront origin is configured with custom headers."""
-        template.has_resource_properties("AWS::CloudFront::Distribution", {
-            "DistributionConfig": {
-                "Origins": [
-                    {
-                        "OriginCustomHeaders": [
-                            {
-                                "HeaderName": "X-Origin-Verify",
-                                "HeaderValue": assertions.Match.any_value()
-                            }
-                        ]
-                    }
-                ]
-            }
-        })
+        distributions = template.resources_of_type("AWS::CloudFront::Distribution")
+        headers = [
+            header
+            for distribution in distributions
+            for origin in distribution["Properties"]["DistributionConfig"]["Origins"]
+            for header in origin.get("OriginCustomHeaders", [])
+        ]
+        assert any(
+            header["HeaderName"] == "X-Origin-Verify" and "HeaderValue" in header
+            for header in headers
+        )
 
     def test_stack_properties(self, stack):
         """Test stack-level properties."""
@@ -147,4 +131,4 @@ class TestWafHttpApiExampleStack:
         assert stack.protected_api is not None
         assert stack.hello_lambda is not None
         assert hasattr(stack.protected_api, 'secret_header_value')
-        assert hasattr(stack.protected_api, 'distribution')
\ No newline at end of file
+        assert hasattr(stack.protected_api, 'distribution')
@@ -11,26 +11,8 @@ from constructs import Construct
 from waf_http_api import WafHttpApi
 
 
-class WafHttpApiExampleStack(Stack):
-    """
-    Python CDK Stack demonstrating WAF-protected HTTP API with CloudFront.
-
-    This stack creates:
-    - Lambda function with Python 3.12 runtime
-    - HTTP API Gateway with multiple routes
-    - WAF-protected CloudFront distribution using the WafHttpApi construct
-    - Origin verification using secret headers
-    """
-
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
-        super().__init__(scope, construct_id, **kwargs)
-
-        # Create a Lambda function that returns a greeting
-        hello_lambda = _lambda.Function(
-            self, "HelloLambda",
-            runtime=_lambda.Runtime.PYTHON_3_12,
-            handler="index.handler",
-            code=_lambda.Code.from_inline("""
+# Inline Lambda handler sources
+_HELLO_SRC = """
 import json
 import os
 from datetime import datetime
@@ -54,17 +36,9 @@ def handler(event, context):
             'userAgent': event.get('headers', {}).get('user-agent'),
         }, indent=2)
     }
-            """)
-        )
+            """
 
-        # Create a Lambda authorizer that validates the secret header
-        authorizer_lambda = _lambda.Function(
-            self,
-            "AuthorizerLambda",
-            runtime=_lambda.Runtime.PYTHON_3_12,
-            handler="index.handler",
-            code=_lambda.Code.from_inline(
-                """
+_AUTHORIZER_SRC = """
 import os
 
 def handler(event, context):
@@ -80,7 +54,37 @@ def handler(event, context):
         print('Authorizer error:', e)
         return { 'isAuthorized': False }
                 """
-            ),
+
+
+class WafHttpApiExampleStack(Stack):
+    """
+    Python CDK Stack demonstrating WAF-protected HTTP API with CloudFront.
+
+    This stack creates:
+    - Lambda function with Python 3.12 runtime
+    - HTTP API Gateway with multiple routes
+    - WAF-protected CloudFront distribution using the WafHttpApi construct
+    - Origin verification using secret headers
+    """
+
+    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        # Create a Lambda function that returns a greeting
+        hello_lambda = _lambda.Function(
+            self, "HelloLambda",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.handler",
+            code=_lambda.Code.from_inline(_HELLO_SRC)
+        )
+
+        # Create a Lambda authorizer that validates the secret header
+        authorizer_lambda = _lambda.Function(
+            self,
+            "AuthorizerLambda",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.handler",
+            code=_lambda.Code.from_inline(_AUTHORIZER_SRC),
         )
 
         # Create the HTTP API Gateway
@@ -186,7 +190,7 @@ def handler(event, context):
         )
 
         # If custom domain is configured, output it
-        if hasattr(protected_api, 'custom_domain') and protected_api.custom_domain:
+        if protected_api.custom_domain:
             CfnOutput(
                 self, "CustomDomainUrl",
                 value=f"https://{protected_api.custom_domain}",